@@ -1,9 +1,7 @@
 """OGuild utilities — reusable logging and helpers for Python projects."""
 
 from .logs import Logger, logger
-from .response import (AuthenticationErrorHandler, CommonErrorHandler,
-                       DatabaseErrorHandler, Error, FileErrorHandler,
-                       NetworkErrorHandler, Ok, ValidationErrorHandler, police)
+from .response import Error, Ok, police
 from .utils import sanitize_fields
 from .middleware import ErrorMiddleware, create_error_middleware
 # Also import from middlewares for plural form compatibility
@@ -38,3 +36,28 @@ __all__ = [
     "MiddlewaresErrorMiddleware",
     "create_error_middlewares",
 ]
+
+# Handler classes resolve lazily through oguild.response (PEP 562) so a
+# plain ``import oguild`` does not load the error-handler modules.
+_LAZY_HANDLERS = frozenset({
+    "CommonErrorHandler",
+    "DatabaseErrorHandler",
+    "ValidationErrorHandler",
+    "NetworkErrorHandler",
+    "AuthenticationErrorHandler",
+    "FileErrorHandler",
+})
+
+
+def __getattr__(name):
+    if name in _LAZY_HANDLERS:
+        from . import response
+
+        obj = getattr(response, name)
+        globals()[name] = obj
+        return obj
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(__all__) | set(globals()))
@@ -1,35 +1,144 @@
 import ast
-import inspect
+import functools
 import json
 import logging
+import logging.handlers
 import os
 import re
+import sys
 import uuid
 
-try:
-    from logstash_async.formatter import LogstashFormatter
-    from logstash_async.handler import AsynchronousLogstashHandler
+# logstash_async is imported on first use so plain Logger construction
+# does not pay for it; None means "not yet attempted".
+LOGSTASH_AVAILABLE = None
+LogstashFormatter = None
+AsynchronousLogstashHandler = None
+
+
+def _load_logstash():
+    """Resolve the optional logstash_async imports on first use."""
+    global LOGSTASH_AVAILABLE, LogstashFormatter, AsynchronousLogstashHandler
+    if LOGSTASH_AVAILABLE is None:
+        try:
+            from logstash_async.formatter import (
+                LogstashFormatter as _formatter,
+            )
+            from logstash_async.handler import (
+                AsynchronousLogstashHandler as _handler,
+            )
+
+            LogstashFormatter = _formatter
+            AsynchronousLogstashHandler = _handler
+            LOGSTASH_AVAILABLE = True
+        except ImportError:
+            LOGSTASH_AVAILABLE = False
+    return LOGSTASH_AVAILABLE
 
-    LOGSTASH_AVAILABLE = True
+
+try:
+    import orjson
 except ImportError:
-    LOGSTASH_AVAILABLE = False
+    orjson = None
 
 
 # Internal storage for runtime-configured log level
 _CONFIGURED_LOG_LEVEL = None
 
+# Matches balanced-ish {...} / [...] runs so they can be pretty-printed;
+# compiled once here instead of on every formatted log call.
+_JSON_STRUCT_RE = re.compile(
+    r"""
+    (
+        \{
+            [^{}]+
+            (?:\{[^{}]*\}[^{}]*)*
+        \}
+        |
+        \[
+            [^\[\]]+
+            (?:\[[^\[\]]*\][^\[\]]*)*
+        \]
+    )
+""",
+    re.VERBOSE | re.DOTALL,
+)
+
+# Local binding so the per-element checks in _sanitize_for_json skip the
+# uuid-module attribute lookup.
+_UUID_CLS = uuid.UUID
+
+
+@functools.lru_cache(maxsize=16)
+def _get_formatter(fmt):
+    """Shared Formatter per format string.
+
+    Formatters hold no per-handler state, so the dynamic wrapper's many
+    module loggers can reuse one instance instead of allocating one per
+    handler.
+    """
+    return logging.Formatter(fmt)
+
+
+def _make_buffered_file_handler(log_file, formatter):
+    """Build a file handler that batches writes through a memory buffer.
+
+    FileHandler flushes on every emit; buffering through a MemoryHandler
+    turns high-volume logging into one write per batch. Records still
+    land immediately at ERROR and above, and logging.shutdown flushes
+    the buffer at exit (MemoryHandler flushes on close).
+    """
+    os.makedirs(os.path.dirname(log_file), exist_ok=True)
+    file_handler = logging.FileHandler(log_file)
+    file_handler.setFormatter(formatter)
+    return logging.handlers.MemoryHandler(
+        capacity=1024, flushLevel=logging.ERROR, target=file_handler
+    )
+
+
+_LEVEL_MAP = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+# (raw LOG_LEVEL value, resolved level) from the last environment read,
+# so repeated Logger construction maps the string once.
+_ENV_LEVEL_CACHE = None
+
 
 def get_default_log_level():
     """Get the effective default log level (configured or from environment)."""
+    global _ENV_LEVEL_CACHE
     if _CONFIGURED_LOG_LEVEL is not None:
         return _CONFIGURED_LOG_LEVEL
-    return getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper())
+    raw = os.getenv("LOG_LEVEL", "INFO")
+    cache = _ENV_LEVEL_CACHE
+    if cache is None or cache[0] != raw:
+        name = raw.upper()
+        level = _LEVEL_MAP.get(name)
+        if level is None:
+            # Aliases like WARN/FATAL resolve (or fail) as before.
+            level = getattr(logging, name)
+        cache = (raw, level)
+        _ENV_LEVEL_CACHE = cache
+    return cache[1]
 
 
 class SmartLogger(logging.Logger):
+    # No per-instance state beyond what logging.Logger already stores;
+    # the base class keeps its __dict__, so this only documents that.
+    __slots__ = ()
+
     uuid_pattern = re.compile(r"UUID\(['\"]([0-9a-fA-F\-]+)['\"]\)")
 
     def _pretty_format(self, msg):
+        # Exact-type dispatch for the common cases; subclasses fall back
+        # to the isinstance chain below.
+        fn = _FORMAT_DISPATCH.get(type(msg))
+        if fn is not None:
+            return fn(self, msg)
         if isinstance(msg, str):
             return self._format_string_message(msg)
         elif isinstance(msg, (dict, list)):
@@ -38,28 +147,15 @@ class SmartLogger(logging.Logger):
 
     def _format_string_message(self, msg):
         """Format string messages with JSON structure detection."""
-        cleaned = self.uuid_pattern.sub(r'"\1"', msg)
-        return self._replace_json_structures(cleaned)
+        # C-level containment check skips the regex engine entirely for
+        # the common message without any UUID repr in it.
+        if "UUID(" in msg:
+            msg = self.uuid_pattern.sub(r'"\1"', msg)
+        return self._replace_json_structures(msg)
 
     def _replace_json_structures(self, text):
         """Replace JSON-like structures with pretty-printed versions."""
-        pattern = re.compile(
-            r"""
-            (
-                \{
-                    [^{}]+
-                    (?:\{[^{}]*\}[^{}]*)*
-                \}
-                |
-                \[
-                    [^\[\]]+
-                    (?:\[[^\[\]]*\][^\[\]]*)*
-                \]
-            )
-        """,
-            re.VERBOSE | re.DOTALL,
-        )
-        return re.sub(pattern, self._try_parse_and_pretty, text)
+        return _JSON_STRUCT_RE.sub(self._try_parse_and_pretty, text)
 
     def _try_parse_and_pretty(self, match):
         """Try to parse and pretty-print a matched JSON structure."""
@@ -72,6 +168,17 @@ class SmartLogger(logging.Logger):
 
     def _format_dict_list_message(self, msg):
         """Format dict/list messages with UUID sanitization."""
+        if orjson is not None:
+            # orjson serializes UUID (and datetime) natively in C, so the
+            # recursive sanitize pass is unnecessary on this branch.
+            try:
+                return orjson.dumps(
+                    msg,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                    default=str,
+                ).decode()
+            except Exception:
+                return str(msg)
         try:
             sanitized = self._sanitize_for_json(msg)
             return json.dumps(sanitized, indent=2, ensure_ascii=False)
@@ -83,21 +190,22 @@ class SmartLogger(logging.Logger):
         if isinstance(obj, dict):
             return {
                 k: self._sanitize_for_json(
-                    str(v) if isinstance(v, uuid.UUID) else v
+                    str(v) if isinstance(v, _UUID_CLS) else v
                 )
                 for k, v in obj.items()
             }
         elif isinstance(obj, list):
             return [self._sanitize_for_json(v) for v in obj]
         else:
-            return str(obj) if isinstance(obj, uuid.UUID) else obj
+            return str(obj) if isinstance(obj, _UUID_CLS) else obj
 
     def _log_with_format_option(
         self, level, msg, args, format=False, **kwargs
     ):
         if format:
             msg = self._pretty_format(msg)
-        super()._log(level, msg, args, **kwargs)
+        # Direct base-class call; skips building a super() proxy per log.
+        logging.Logger._log(self, level, msg, args, **kwargs)
 
     def info(self, msg, *args, format=False, **kwargs):
         if self.isEnabledFor(logging.INFO):
@@ -130,6 +238,14 @@ class SmartLogger(logging.Logger):
             )
 
 
+# Exact-type formatting dispatch for _pretty_format.
+_FORMAT_DISPATCH = {
+    str: SmartLogger._format_string_message,
+    dict: SmartLogger._format_dict_list_message,
+    list: SmartLogger._format_dict_list_message,
+}
+
+
 class _DynamicLoggerWrapper:
     """
     Internal wrapper that dynamically detects the calling module at log time.
@@ -153,26 +269,31 @@ class _DynamicLoggerWrapper:
         self._logstash_port = logstash_port
         self._logstash_database_path = logstash_database_path
         self._loggers = {}  # Cache of loggers by module name
+        self._code_loggers = {}  # Cache of loggers by call-site code object
+
+    # Modules to ignore when detecting the caller
+    _IGNORE_MODULES = (
+        "oguild.logs", "oguild.log", "oguild", "logging",
+        "_pytest", "pytest", "unittest", "pluggy"
+    )
 
     def _get_caller_module_name(self):
         """Auto-detect the calling module from the stack."""
-        # Modules to ignore when detecting the caller
-        ignore_modules = (
-            "oguild.logs", "oguild.log", "oguild", "logging",
-            "_pytest", "pytest", "unittest", "pluggy"
-        )
-
-        for frame_info in inspect.stack():
-            frame = frame_info.frame
+        # Walk raw frames instead of inspect.stack(), which resolves
+        # source context for every frame on every log call.
+        frame = sys._getframe(1)
+        while frame is not None:
             module_name = frame.f_globals.get("__name__")
             if module_name and not any(
-                module_name.startswith(m) for m in ignore_modules
+                module_name.startswith(m) for m in self._IGNORE_MODULES
             ):
                 return module_name
+            frame = frame.f_back
         return "__main__"
 
     def _get_or_create_logger(self, module_name):
         """Get existing logger or create a new one for the module."""
+        module_name = sys.intern(module_name)
         if module_name not in self._loggers:
             logging.setLoggerClass(SmartLogger)
             log = logging.getLogger(module_name)
@@ -180,7 +301,7 @@ class _DynamicLoggerWrapper:
             log.propagate = False
 
             if not log.handlers:
-                formatter = logging.Formatter(self._log_format)
+                formatter = _get_formatter(self._log_format)
 
                 # Console handler
                 console_handler = logging.StreamHandler()
@@ -189,13 +310,12 @@ class _DynamicLoggerWrapper:
 
                 # File handler
                 if self._log_file:
-                    os.makedirs(os.path.dirname(self._log_file), exist_ok=True)
-                    file_handler = logging.FileHandler(self._log_file)
-                    file_handler.setFormatter(formatter)
-                    log.addHandler(file_handler)
+                    log.addHandler(
+                        _make_buffered_file_handler(self._log_file, formatter)
+                    )
 
                 # Logstash handler
-                if self._logstash_host and LOGSTASH_AVAILABLE:
+                if self._logstash_host and _load_logstash():
                     try:
                         logstash_handler = AsynchronousLogstashHandler(
                             host=self._logstash_host,
@@ -215,8 +335,15 @@ class _DynamicLoggerWrapper:
 
     def _log(self, level, msg, *args, **kwargs):
         """Internal method to log with dynamic detection."""
-        module_name = self._get_caller_module_name()
-        log = self._get_or_create_logger(module_name)
+        # Repeated calls from the same call site resolve to the same
+        # logger; key on the caller's code object so the module walk
+        # runs once per call site instead of once per log call.
+        key = sys._getframe(2).f_code
+        log = self._code_loggers.get(key)
+        if log is None:
+            module_name = self._get_caller_module_name()
+            log = self._get_or_create_logger(module_name)
+            self._code_loggers[key] = log
         getattr(log, level)(msg, *args, **kwargs)
 
     def info(self, msg, *args, **kwargs):
@@ -320,12 +447,14 @@ class Logger:
                       logstash_host, logstash_port, logstash_database_path):
         """Setup the logger with handlers."""
         logging.setLoggerClass(SmartLogger)
-        self.logger = logging.getLogger(logger_name)
+        # Interned names let the manager's loggerDict lookup compare by
+        # identity on repeat construction.
+        self.logger = logging.getLogger(sys.intern(logger_name))
         self.logger.setLevel(log_level)
         self.logger.propagate = False
 
         if not self.logger.handlers:
-            formatter = logging.Formatter(log_format)
+            formatter = _get_formatter(log_format)
             self._add_console_handler(formatter)
             self._add_file_handler(log_file, formatter)
             self._add_logstash_handler(logstash_host, logstash_port,
@@ -340,15 +469,14 @@ class Logger:
     def _add_file_handler(self, log_file, formatter):
         """Add file handler to logger if log_file is specified."""
         if log_file:
-            os.makedirs(os.path.dirname(log_file), exist_ok=True)
-            file_handler = logging.FileHandler(log_file)
-            file_handler.setFormatter(formatter)
-            self.logger.addHandler(file_handler)
+            self.logger.addHandler(
+                _make_buffered_file_handler(log_file, formatter)
+            )
 
     def _add_logstash_handler(self, logstash_host, logstash_port,
                               logstash_database_path):
         """Add logstash handler to logger if available and configured."""
-        if logstash_host and LOGSTASH_AVAILABLE:
+        if logstash_host and _load_logstash():
             try:
                 logstash_handler = AsynchronousLogstashHandler(
                     host=logstash_host,
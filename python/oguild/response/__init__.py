@@ -1,10 +1,20 @@
 """Response utilities for oguild."""
 
-from .errors import (AuthenticationErrorHandler, CommonErrorHandler,
-                     DatabaseErrorHandler, FileErrorHandler,
-                     NetworkErrorHandler, ValidationErrorHandler)
+import importlib
+
 from .response import Ok, Error, police
 
+# Handler classes resolve lazily (PEP 562) so importing this package for
+# Ok/Error/police does not load every error-handler module.
+_LAZY_HANDLERS = {
+    "CommonErrorHandler": ".errors.common_errors",
+    "DatabaseErrorHandler": ".errors.database_errors",
+    "ValidationErrorHandler": ".errors.validation_errors",
+    "NetworkErrorHandler": ".errors.network_errors",
+    "AuthenticationErrorHandler": ".errors.authentication_errors",
+    "FileErrorHandler": ".errors.file_errors",
+}
+
 __all__ = [
     "Ok",
     "Error",
@@ -16,3 +26,16 @@ __all__ = [
     "AuthenticationErrorHandler",
     "FileErrorHandler",
 ]
+
+
+def __getattr__(name):
+    module_path = _LAZY_HANDLERS.get(name)
+    if module_path:
+        obj = getattr(importlib.import_module(module_path, __name__), name)
+        globals()[name] = obj
+        return obj
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(__all__)
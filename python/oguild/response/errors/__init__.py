@@ -1,11 +1,17 @@
 """Error handling modules for oguild response system."""
 
-from .common_errors import CommonErrorHandler
-from .database_errors import DatabaseErrorHandler
-from .validation_errors import ValidationErrorHandler
-from .network_errors import NetworkErrorHandler
-from .authentication_errors import AuthenticationErrorHandler
-from .file_errors import FileErrorHandler
+import importlib
+
+# Each handler lives in its own module; resolve on first access (PEP 562)
+# so importing the package does not load all of them.
+_LAZY_HANDLERS = {
+    "CommonErrorHandler": ".common_errors",
+    "DatabaseErrorHandler": ".database_errors",
+    "ValidationErrorHandler": ".validation_errors",
+    "NetworkErrorHandler": ".network_errors",
+    "AuthenticationErrorHandler": ".authentication_errors",
+    "FileErrorHandler": ".file_errors",
+}
 
 __all__ = [
     "CommonErrorHandler",
@@ -15,3 +21,16 @@ __all__ = [
     "AuthenticationErrorHandler",
     "FileErrorHandler",
 ]
+
+
+def __getattr__(name):
+    module_path = _LAZY_HANDLERS.get(name)
+    if module_path:
+        obj = getattr(importlib.import_module(module_path, __name__), name)
+        globals()[name] = obj
+        return obj
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(__all__)
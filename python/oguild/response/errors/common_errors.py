@@ -1,103 +1,230 @@
+import importlib
 import json
-from typing import Any, Dict
+import sys
+from types import MappingProxyType
+from typing import Any, Dict, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from starlette.exceptions import (  # noqa: F401
+        HTTPException as BaseHTTPException,
+    )
+    from werkzeug.exceptions import (  # noqa: F401
+        HTTPException as WerkzeugHTTPException,
+    )
 
 try:
-    from fastapi import HTTPException as FastAPIHTTPException
+    import orjson
 except ImportError:
-    FastAPIHTTPException = None
-
-try:
-    from starlette.exceptions import HTTPException as StarletteHTTPException
-except ImportError:
-    StarletteHTTPException = None
-
-try:
-    from django.http import (HttpResponseBadRequest, HttpResponseForbidden,
-                             HttpResponseNotFound, HttpResponseServerError)
-
-    DjangoHTTPExceptions = {
-        400: HttpResponseBadRequest,
-        403: HttpResponseForbidden,
-        404: HttpResponseNotFound,
-        500: HttpResponseServerError,
-    }
-except ImportError:
-    DjangoHTTPExceptions = {}
-
-try:
-    from werkzeug.exceptions import HTTPException as WerkzeugHTTPException
-except ImportError:
-    WerkzeugHTTPException = None
-
-try:
-    from starlette.exceptions import HTTPException as BaseHTTPException
-except ImportError:
-    BaseHTTPException = Exception
+    orjson = None
+
+# Framework exception classes are resolved lazily (PEP 562) so importing
+# this module does not drag in FastAPI/Starlette/Django/Werkzeug when the
+# host app only uses one of them (or none).
+_LAZY = {
+    "FastAPIHTTPException": ("fastapi", "HTTPException"),
+    "StarletteHTTPException": ("starlette.exceptions", "HTTPException"),
+    "WerkzeugHTTPException": ("werkzeug.exceptions", "HTTPException"),
+}
+
+_DJANGO_RESPONSES = (
+    (400, "HttpResponseBadRequest"),
+    (403, "HttpResponseForbidden"),
+    (404, "HttpResponseNotFound"),
+    (500, "HttpResponseServerError"),
+)
+
+
+def __getattr__(name):
+    """Resolve framework exception classes on first access and cache them."""
+    if name in _LAZY:
+        module_name, attr = _LAZY[name]
+        try:
+            value = getattr(importlib.import_module(module_name), attr)
+        except ImportError:
+            value = None
+        globals()[name] = value
+        return value
+
+    if name == "BaseHTTPException":
+        try:
+            value = importlib.import_module(
+                "starlette.exceptions"
+            ).HTTPException
+        except ImportError:
+            value = Exception
+        globals()[name] = value
+        return value
+
+    if name == "DjangoHTTPExceptions":
+        try:
+            http = importlib.import_module("django.http")
+            value = {
+                code: getattr(http, cls_name)
+                for code, cls_name in _DJANGO_RESPONSES
+            }
+        except ImportError:
+            value = {}
+        globals()[name] = value
+        return value
+
+    if name == "_DJANGO_CLASS_TO_STATUS":
+        # Inverse of DjangoHTTPExceptions: one MRO walk against this map
+        # replaces the per-class isinstance probes.
+        value = {
+            cls: code
+            for code, cls in sys.modules[__name__].DjangoHTTPExceptions.items()
+        }
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Exact-type templates for standard exceptions, interned once at module
+# scope as read-only mappings. Callers only read them or merge them into
+# their own dict, so the constant cases return the shared singleton.
+_STD_ERROR_TEMPLATES = {
+    ValueError: MappingProxyType({
+        "level": "WARNING",
+        "http_status_code": 400,
+        "message": "Invalid value provided.",
+    }),
+    TypeError: MappingProxyType({
+        "level": "WARNING",
+        "http_status_code": 400,
+        "message": "Type mismatch in request.",
+    }),
+    IndexError: MappingProxyType({
+        "level": "WARNING",
+        "http_status_code": 400,
+        "message": "Index out of range.",
+    }),
+    AttributeError: MappingProxyType({
+        "level": "ERROR",
+        "http_status_code": 500,
+        "message": "Attribute error in processing the request.",
+    }),
+    PermissionError: MappingProxyType({
+        "level": "WARNING",
+        "http_status_code": 403,
+        "message": "You do not have permission to perform this action.",
+    }),
+    FileNotFoundError: MappingProxyType({
+        "level": "WARNING",
+        "http_status_code": 404,
+        "message": "Requested file was not found.",
+    }),
+    MemoryError: MappingProxyType({
+        "level": "ERROR",
+        "http_status_code": 507,
+        "message": "Insufficient memory to process the request.",
+    }),
+    TimeoutError: MappingProxyType({
+        "level": "WARNING",
+        "http_status_code": 408,
+        "message": "Request timeout occurred.",
+    }),
+    ConnectionError: MappingProxyType({
+        "level": "ERROR",
+        "http_status_code": 503,
+        "message": "Connection error occurred.",
+    }),
+    OSError: MappingProxyType({
+        "level": "ERROR",
+        "http_status_code": 500,
+        "message": "Operating system error occurred.",
+    }),
+}
+
+# Exceptions whose message should echo str(e) when it is non-empty.
+_STD_USE_STR = frozenset({ValueError, TypeError})
 
 
 class CommonErrorHandler:
     """Handler for common Python exceptions and framework-specific errors."""
 
+    __slots__ = ("logger",)
+
+    # (framework class, unbound handler) pairs in dispatch order, resolved
+    # once on first construction; absent frameworks are filtered out.
+    # _http_exc_types is the same classes as one tuple, so the common
+    # non-HTTP case is rejected by a single isinstance call.
+    _http_dispatch = None
+    _http_exc_types = ()
+
     def __init__(self, logger):
         self.logger = logger
+        if CommonErrorHandler._http_dispatch is None:
+            # Attribute access on the module goes through __getattr__, so
+            # framework classes resolve only when errors start flowing.
+            _m = sys.modules[__name__]
+            CommonErrorHandler._http_dispatch = tuple(
+                (cls, fn)
+                for cls, fn in (
+                    (
+                        _m.BaseHTTPException,
+                        CommonErrorHandler._handle_http_exception,
+                    ),
+                    (
+                        _m.FastAPIHTTPException,
+                        CommonErrorHandler._handle_http_exception,
+                    ),
+                    (
+                        _m.StarletteHTTPException,
+                        CommonErrorHandler._handle_http_exception,
+                    ),
+                    (
+                        _m.WerkzeugHTTPException,
+                        CommonErrorHandler._handle_werkzeug_exception,
+                    ),
+                )
+                if cls is not None
+            )
+            CommonErrorHandler._http_exc_types = tuple(
+                cls for cls, _ in CommonErrorHandler._http_dispatch
+            )
 
     def handle_error(self, e: Exception) -> Dict[str, Any]:
         """Handle common Python exceptions and return error details."""
-        error_info = {
-            "level": "ERROR",
-            "http_status_code": 500,
-            "message": "An unexpected error occurred.",
-            "error_type": type(e).__name__,
-        }
-
-        if isinstance(e, BaseHTTPException):
-            error_info.update(self._handle_http_exception(e))
-        elif FastAPIHTTPException and isinstance(e, FastAPIHTTPException):
-            error_info.update(self._handle_fastapi_exception(e))
-        elif StarletteHTTPException and isinstance(e, StarletteHTTPException):
-            error_info.update(self._handle_starlette_exception(e))
-        elif WerkzeugHTTPException and isinstance(e, WerkzeugHTTPException):
-            error_info.update(self._handle_werkzeug_exception(e))
-        elif DjangoHTTPExceptions and any(
-            isinstance(e, exc_class)
-            for exc_class in DjangoHTTPExceptions.values()
-        ):
-            error_info.update(self._handle_django_exception(e))
-        else:
-            error_info.update(self._handle_standard_exceptions(e))
-
-        return error_info
-
-    def _handle_http_exception(self, e: BaseHTTPException) -> Dict[str, Any]:
-        """Handle Starlette HTTPException."""
-        return {
-            "level": "WARNING",
-            "http_status_code": getattr(e, "status_code", 500),
-            "message": getattr(e, "detail", "HTTP error occurred."),
-        }
-
-    def _handle_fastapi_exception(
-        self, e: FastAPIHTTPException
+        _m = sys.modules[__name__]
+        error_type = type(e).__name__
+
+        if self._http_exc_types and isinstance(e, self._http_exc_types):
+            for cls, fn in self._http_dispatch:
+                if isinstance(e, cls):
+                    # Framework handlers build fresh dicts, safe to extend.
+                    info = fn(self, e)
+                    info["error_type"] = error_type
+                    return info
+
+        django_map = _m._DJANGO_CLASS_TO_STATUS
+        if django_map:
+            for cls in type(e).__mro__:
+                status_code = django_map.get(cls)
+                if status_code is not None:
+                    return {
+                        "level": "WARNING",
+                        "http_status_code": status_code,
+                        "message": str(e) or "HTTP error occurred.",
+                        "error_type": error_type,
+                    }
+
+        # Standard-exception results may be shared templates; merge into a
+        # fresh dict instead of mutating them.
+        return {**self._handle_standard_exceptions(e), "error_type": error_type}
+
+    def _handle_http_exception(
+        self, e: "BaseHTTPException"
     ) -> Dict[str, Any]:
-        """Handle FastAPI HTTPException."""
+        """Handle FastAPI/Starlette-style HTTPException."""
         return {
             "level": "WARNING",
-            "http_status_code": e.status_code,
-            "message": e.detail or "HTTP error occurred.",
-        }
-
-    def _handle_starlette_exception(
-        self, e: StarletteHTTPException
-    ) -> Dict[str, Any]:
-        """Handle Starlette HTTPException."""
-        return {
-            "level": "WARNING",
-            "http_status_code": e.status_code,
-            "message": e.detail or "HTTP error occurred.",
+            "http_status_code": getattr(e, "status_code", 500),
+            "message": getattr(e, "detail", None) or "HTTP error occurred.",
         }
 
     def _handle_werkzeug_exception(
-        self, e: WerkzeugHTTPException
+        self, e: "WerkzeugHTTPException"
     ) -> Dict[str, Any]:
         """Handle Werkzeug HTTPException."""
         return {
@@ -106,56 +233,30 @@ class CommonErrorHandler:
             "message": e.description or "HTTP error occurred.",
         }
 
-    def _handle_django_exception(self, e: Exception) -> Dict[str, Any]:
-        """Handle Django HTTP exceptions."""
-        for status_code, exc_class in DjangoHTTPExceptions.items():
-            if isinstance(e, exc_class):
-                return {
-                    "level": "WARNING",
-                    "http_status_code": status_code,
-                    "message": str(e) or "HTTP error occurred.",
-                }
-        return {
-            "level": "ERROR",
-            "http_status_code": 500,
-            "message": "Django HTTP error occurred.",
-        }
-
     def _handle_standard_exceptions(self, e: Exception) -> Dict[str, Any]:
         """Handle standard Python exceptions."""
-        exception_handlers = {
-            ValueError: self._handle_value_error,
-            TypeError: self._handle_type_error,
-            KeyError: self._handle_key_error,
-            IndexError: self._handle_index_error,
-            AttributeError: self._handle_attribute_error,
-            PermissionError: self._handle_permission_error,
-            FileNotFoundError: self._handle_file_not_found_error,
-            MemoryError: self._handle_memory_error,
-            TimeoutError: self._handle_timeout_error,
-            ConnectionError: self._handle_connection_error,
-            OSError: self._handle_os_error,
-        }
-
-        handler = exception_handlers.get(type(e))
-        if handler:
-            return handler(e)
-
-        return self._handle_generic_error(e)
-
-    def _handle_value_error(self, e: ValueError) -> Dict[str, Any]:
-        return {
-            "level": "WARNING",
-            "http_status_code": 400,
-            "message": str(e) or "Invalid value provided.",
-        }
-
-    def _handle_type_error(self, e: TypeError) -> Dict[str, Any]:
-        return {
-            "level": "WARNING",
-            "http_status_code": 400,
-            "message": str(e) or "Type mismatch in request.",
-        }
+        cls = type(e)
+        if cls is KeyError:
+            return self._handle_key_error(e)
+
+        entry = _STD_ERROR_TEMPLATES.get(cls)
+        if entry is None:
+            # Subclasses still dispatch via a single MRO walk.
+            for base in cls.__mro__:
+                if base is KeyError:
+                    return self._handle_key_error(e)
+                entry = _STD_ERROR_TEMPLATES.get(base)
+                if entry is not None:
+                    break
+
+        if entry is None:
+            return self._handle_generic_error(e)
+
+        if cls in _STD_USE_STR:
+            message = str(e)
+            if message:
+                return {**entry, "message": message}
+        return entry
 
     def _handle_key_error(self, e: KeyError) -> Dict[str, Any]:
         key = str(e).strip("'\"") if e.args else "Key"
@@ -165,62 +266,6 @@ class CommonErrorHandler:
             "message": f"Missing key: {key}.",
         }
 
-    def _handle_index_error(self, e: IndexError) -> Dict[str, Any]:
-        return {
-            "level": "WARNING",
-            "http_status_code": 400,
-            "message": "Index out of range.",
-        }
-
-    def _handle_attribute_error(self, e: AttributeError) -> Dict[str, Any]:
-        return {
-            "level": "ERROR",
-            "http_status_code": 500,
-            "message": "Attribute error in processing the request.",
-        }
-
-    def _handle_permission_error(self, e: PermissionError) -> Dict[str, Any]:
-        return {
-            "level": "WARNING",
-            "http_status_code": 403,
-            "message": "You do not have permission to perform this action.",
-        }
-
-    def _handle_file_not_found_error(self, e: FileNotFoundError) -> Dict[str, Any]:
-        return {
-            "level": "WARNING",
-            "http_status_code": 404,
-            "message": "Requested file was not found.",
-        }
-
-    def _handle_memory_error(self, e: MemoryError) -> Dict[str, Any]:
-        return {
-            "level": "ERROR",
-            "http_status_code": 507,
-            "message": "Insufficient memory to process the request.",
-        }
-
-    def _handle_timeout_error(self, e: TimeoutError) -> Dict[str, Any]:
-        return {
-            "level": "WARNING",
-            "http_status_code": 408,
-            "message": "Request timeout occurred.",
-        }
-
-    def _handle_connection_error(self, e: ConnectionError) -> Dict[str, Any]:
-        return {
-            "level": "ERROR",
-            "http_status_code": 503,
-            "message": "Connection error occurred.",
-        }
-
-    def _handle_os_error(self, e: OSError) -> Dict[str, Any]:
-        return {
-            "level": "ERROR",
-            "http_status_code": 500,
-            "message": "Operating system error occurred.",
-        }
-
     def _handle_generic_error(self, e: Exception) -> Dict[str, Any]:
         return {
             "level": "ERROR",
@@ -229,25 +274,63 @@ class CommonErrorHandler:
         }
 
     def get_exception_attributes(self, e: Exception) -> str:
-        """Get attributes of an exception for logging."""
+        """Get attributes of an exception for logging.
+
+        Walks the instance ``__dict__`` plus the data descriptors on the
+        exception's classes instead of ``dir(e)``, so only real data
+        attributes are visited — not every inherited method name.
+        """
         attrs = {}
 
-        for attr in dir(e):
-            if attr.startswith("__"):
-                continue
-            try:
-                value = getattr(e, attr)
-                if value is None:
+        instance_dict = getattr(e, "__dict__", None)
+        if instance_dict:
+            for attr, value in instance_dict.items():
+                if attr.startswith("__") or value is None:
+                    continue
+                # Interned keys hash/compare by identity when the same
+                # exception type is logged repeatedly.
+                attrs[sys.intern(attr)] = self._stringify(value)
+
+        # Data descriptors cover ``__slots__`` and the C-level storage
+        # builtin exceptions use: the OSError family keeps errno, strerror
+        # and filename there, invisible to the instance ``__dict__``.
+        for cls in type(e).__mro__:
+            for attr, member in cls.__dict__.items():
+                if (
+                    attr.startswith("__")
+                    or callable(member)
+                    or not hasattr(member, "__set__")
+                ):
+                    continue
+                attr = sys.intern(attr)
+                if attr in attrs:
+                    continue
+                try:
+                    value = getattr(e, attr)
+                except AttributeError:
+                    continue
+                except Exception:
+                    attrs[attr] = "<could not retrieve>"
                     continue
-                if isinstance(value, (str, int, float, bool)):
-                    attrs[attr] = value
-                elif isinstance(value, (list, tuple)):
-                    attrs[attr] = [str(v) for v in value]
-                elif isinstance(value, dict):
-                    attrs[attr] = {k: str(v) for k, v in value.items()}
-                else:
-                    attrs[attr] = str(value)
-            except Exception:
-                attrs[attr] = "<could not retrieve>"
-
-        return json.dumps(dict(sorted(attrs.items())), indent=2)
+                if value is not None:
+                    attrs[attr] = self._stringify(value)
+
+        if e.args:
+            attrs.setdefault("args", [str(v) for v in e.args])
+
+        if orjson is not None:
+            return orjson.dumps(
+                attrs, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+            ).decode()
+        return json.dumps(attrs, indent=2, sort_keys=True)
+
+    @staticmethod
+    def _stringify(value: Any) -> Any:
+        """Coerce an attribute value into a JSON-serializable form."""
+        if isinstance(value, (str, int, float, bool)):
+            return value
+        if isinstance(value, (list, tuple)):
+            return [str(v) for v in value]
+        if isinstance(value, dict):
+            return {k: str(v) for k, v in value.items()}
+        return str(value)
@@ -1,86 +1,174 @@
+import functools
 import re
-from typing import Any, Dict
+import sys
+from types import MappingProxyType
+from typing import Any, Dict, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import asyncpg  # noqa: F401
+    import psycopg2  # noqa: F401
+    import pymongo.errors  # noqa: F401
+    import redis  # noqa: F401
+    import sqlite3  # noqa: F401
+
+_UNDEFINED_COL_RE = re.compile(r'column "(?P<col>[^"]+)" does not exist')
+
+# Constraint names come in two shapes: "fk_user" (prefix style) and
+# "users_email_key" (table_column_suffix style). One pass with a cached
+# regex extracts the field tokens without the per-call split() list.
+_PREFIX_CONSTRAINT_RE = re.compile(
+    r"^(?:fk|uq|ck|chk)_(?P<body>.+?)(?:_(?:id|key|fkey|unique|check))*$"
+)
+_TABLE_CONSTRAINT_RE = re.compile(
+    r"^[^_]+_(?P<body>.+?)(?:_(?:id|key|fkey|unique|check))+$"
+)
+
+# One scan of the message replaces four sequential substring checks.
+_DATA_ERR_RE = re.compile(
+    r"(out of range"
+    r"|invalid input syntax"
+    r"|invalid input value for enum"
+    r"|invalid uuid)"
+)
+
+# Constant outcome mappings are interned once and returned as-is; the
+# MappingProxyType wrapper keeps the shared singletons read-only while
+# still working with dict.update() at the call sites.
+_DATA_ERR_TEMPLATES = {
+    "out of range": MappingProxyType({
+        "http_status_code": 400,
+        "message": "Provided value is out of allowed range.",
+    }),
+    "invalid input syntax": MappingProxyType({
+        "http_status_code": 400,
+        "message": "Invalid input syntax for a field.",
+    }),
+    "invalid input value for enum": MappingProxyType({
+        "http_status_code": 400,
+        "message": "Invalid value provided for enum field.",
+    }),
+    "invalid uuid": MappingProxyType({
+        "http_status_code": 400,
+        "message": "Invalid ID format provided.",
+    }),
+}
+
+_MSG_INVALID_DATA = MappingProxyType({
+    "http_status_code": 400,
+    "message": "Invalid data provided.",
+})
+_MSG_RESOURCE_EXISTS = MappingProxyType({
+    "http_status_code": 409,
+    "message": "Resource already exists.",
+})
+_MSG_FK_INVALID = MappingProxyType({
+    "http_status_code": 400,
+    "message": "Invalid foreign key reference.",
+})
+_MSG_FK_FAILED = MappingProxyType({
+    "http_status_code": 400,
+    "message": "Foreign key constraint failed.",
+})
+_MSG_CHECK_FAILED = MappingProxyType({
+    "http_status_code": 400,
+    "message": "Check constraint failed.",
+})
+_MSG_FIELD_REQUIRED = MappingProxyType({
+    "http_status_code": 400,
+    "message": "A required field is missing.",
+})
+_MSG_INVALID_COLUMN = MappingProxyType({
+    "http_status_code": 500,
+    "message": "Invalid column reference.",
+})
+
+# Driver modules are looked up in sys.modules instead of being imported
+# eagerly: if the host app never imported a driver, its exceptions cannot
+# occur, so this module never pays that driver's import cost.
+_DRIVER_DISPATCH = (
+    ("asyncpg", "PostgresError", "_handle_asyncpg_error"),
+    ("psycopg2", "Error", "_handle_psycopg2_error"),
+    ("sqlite3", "Error", "_handle_sqlite3_error"),
+    ("pymongo.errors", "PyMongoError", "_handle_pymongo_error"),
+    ("redis", "RedisError", "_handle_redis_error"),
+)
 
-try:
-    import asyncpg
 
-    ASYNCPG_AVAILABLE = True
-except ImportError:
-    ASYNCPG_AVAILABLE = False
-    asyncpg = None
-
-try:
-    import psycopg2
-
-    PSYCOPG2_AVAILABLE = True
-except ImportError:
-    PSYCOPG2_AVAILABLE = False
-    psycopg2 = None
-
-try:
-    import sqlite3
-
-    SQLITE3_AVAILABLE = True
-except ImportError:
-    SQLITE3_AVAILABLE = False
-    sqlite3 = None
-
-try:
-    import pymongo
-
-    PYMONGO_AVAILABLE = True
-except ImportError:
-    PYMONGO_AVAILABLE = False
-    pymongo = None
-
-try:
-    import redis
+class DatabaseErrorHandler:
+    """Handler for database-specific errors."""
 
-    REDIS_AVAILABLE = True
-except ImportError:
-    REDIS_AVAILABLE = False
-    redis = None
+    __slots__ = ("logger",)
 
+    # Per-driver dispatch tables keyed by exception type, built lazily on
+    # first use (the driver classes only exist once a driver error arrives).
+    # Values are either an unbound handler method or a template dict.
+    _asyncpg_dispatch = None
+    _psycopg2_dispatch = None
+    _sqlite3_dispatch = None
+    _pymongo_dispatch = None
+    _redis_dispatch = None
 
-class DatabaseErrorHandler:
-    """Handler for database-specific errors."""
+    # (base exception, unbound handler) pairs for the drivers the host app
+    # has actually imported; rebuilt only when that set changes.
+    _db_handlers = ()
+    _db_handlers_key = None
 
     def __init__(self, logger):
         self.logger = logger
 
+    @classmethod
+    def _get_db_handlers(cls):
+        loaded = tuple(
+            spec for spec in _DRIVER_DISPATCH if spec[0] in sys.modules
+        )
+        if loaded != cls._db_handlers_key:
+            handlers = []
+            for module_name, attr, handler_name in loaded:
+                base = getattr(sys.modules[module_name], attr, None)
+                if base is not None:
+                    handlers.append((base, getattr(cls, handler_name)))
+            cls._db_handlers = tuple(handlers)
+            cls._db_handlers_key = loaded
+        return cls._db_handlers
+
+    def _dispatch_mro(self, dispatch, e, error_info):
+        """Apply the most specific dispatch entry via one MRO walk.
+
+        The walk's answer is memoized under the concrete type, so each
+        distinct exception class pays for the MRO scan only once.
+        """
+        cls = type(e)
+        entry = dispatch.get(cls)
+        if entry is None:
+            for base in cls.__mro__:
+                entry = dispatch.get(base)
+                if entry is not None:
+                    dispatch[cls] = entry
+                    break
+        if entry is not None:
+            if callable(entry):
+                error_info.update(entry(self, e))
+            else:
+                error_info.update(entry)
+        return error_info
+
     def _is_database_error(self, e: Exception) -> bool:
         """Check if the exception is a database-related error."""
-        if ASYNCPG_AVAILABLE and isinstance(e, asyncpg.PostgresError):
-            return True
-        elif PSYCOPG2_AVAILABLE and isinstance(e, psycopg2.Error):
-            return True
-        elif SQLITE3_AVAILABLE and isinstance(e, sqlite3.Error):
-            return True
-        elif PYMONGO_AVAILABLE and isinstance(e, pymongo.errors.PyMongoError):
-            return True
-        elif REDIS_AVAILABLE and isinstance(e, redis.RedisError):
-            return True
-        return False
+        return any(
+            isinstance(e, base) for base, _ in self._get_db_handlers()
+        )
 
     def handle_error(self, e: Exception) -> Dict[str, Any]:
         """Handle database-specific errors and return error details."""
-        if ASYNCPG_AVAILABLE and isinstance(e, asyncpg.PostgresError):
-            return self._handle_asyncpg_error(e)
-        elif PSYCOPG2_AVAILABLE and isinstance(e, psycopg2.Error):
-            return self._handle_psycopg2_error(e)
-        elif SQLITE3_AVAILABLE and isinstance(e, sqlite3.Error):
-            return self._handle_sqlite3_error(e)
-        elif PYMONGO_AVAILABLE and isinstance(e, pymongo.errors.PyMongoError):
-            return self._handle_pymongo_error(e)
-        elif REDIS_AVAILABLE and isinstance(e, redis.RedisError):
-            return self._handle_redis_error(e)
-        else:
-            return {
-                "level": "ERROR",
-                "http_status_code": 500,
-                "message": "Database error occurred.",
-                "error_type": type(e).__name__,
-            }
+        for base, handler in self._get_db_handlers():
+            if isinstance(e, base):
+                return handler(self, e)
+        return {
+            "level": "ERROR",
+            "http_status_code": 500,
+            "message": "Database error occurred.",
+            "error_type": type(e).__name__,
+        }
 
     def _handle_asyncpg_error(
         self, e: "asyncpg.PostgresError"
@@ -93,72 +181,66 @@ class DatabaseErrorHandler:
             "error_type": type(e).__name__,
         }
 
-        # Use a mapping approach to reduce complexity
-        error_handlers = {
-            asyncpg.exceptions.UniqueViolationError: self._handle_unique_violation,
-            asyncpg.exceptions.ForeignKeyViolationError: self._handle_foreign_key_violation,
-            asyncpg.exceptions.CheckViolationError: self._handle_check_violation,
-            asyncpg.exceptions.NotNullViolationError: self._handle_not_null_violation,
-            asyncpg.exceptions.UndefinedColumnError: self._handle_undefined_column,
-            asyncpg.exceptions.DataError: self._handle_data_error,
-        }
-
-        # Check for specific error types with handlers
-        for error_type, handler in error_handlers.items():
-            if isinstance(e, error_type):
-                error_info.update(handler(e))
-                return error_info
-
-        # Handle specific error types without separate handlers
-        specific_errors = {
-            asyncpg.exceptions.InvalidTextRepresentationError: {
-                "http_status_code": 400,
-                "message": "Invalid input syntax for a field.",
-            },
-            asyncpg.exceptions.PostgresSyntaxError: {
-                "http_status_code": 500,
-                "message": "Something went wrong while processing your request.",
-            },
-            asyncpg.exceptions.NumericValueOutOfRangeError: {
-                "http_status_code": 400,
-                "message": "A numeric value is out of range.",
-            },
-            asyncpg.exceptions.DivisionByZeroError: {
-                "http_status_code": 400,
-                "message": "Attempted division by zero.",
-            },
-            asyncpg.exceptions.StringDataRightTruncationError: {
-                "http_status_code": 400,
-                "message": "Input string is too long for the column.",
-            },
-            asyncpg.exceptions.InvalidDatetimeFormatError: {
-                "http_status_code": 400,
-                "message": "Invalid datetime format.",
-            },
-        }
-
-        for error_type, error_details in specific_errors.items():
-            if isinstance(e, error_type):
-                error_info.update(error_details)
-                return error_info
-
-        # Handle connection errors
-        if isinstance(e, asyncpg.exceptions.ConnectionDoesNotExistError):
-            error_info.update(
-                {
+        dispatch = DatabaseErrorHandler._asyncpg_dispatch
+        if dispatch is None:
+            # Already in sys.modules — the error we hold came from it.
+            import asyncpg
+
+            exc = asyncpg.exceptions
+            dispatch = DatabaseErrorHandler._asyncpg_dispatch = {
+                exc.UniqueViolationError: (
+                    DatabaseErrorHandler._handle_unique_violation
+                ),
+                exc.ForeignKeyViolationError: (
+                    DatabaseErrorHandler._handle_foreign_key_violation
+                ),
+                exc.CheckViolationError: (
+                    DatabaseErrorHandler._handle_check_violation
+                ),
+                exc.NotNullViolationError: (
+                    DatabaseErrorHandler._handle_not_null_violation
+                ),
+                exc.UndefinedColumnError: (
+                    DatabaseErrorHandler._handle_undefined_column
+                ),
+                exc.DataError: DatabaseErrorHandler._handle_data_error,
+                exc.InvalidTextRepresentationError: {
+                    "http_status_code": 400,
+                    "message": "Invalid input syntax for a field.",
+                },
+                exc.PostgresSyntaxError: {
+                    "http_status_code": 500,
+                    "message": (
+                        "Something went wrong while processing your request."
+                    ),
+                },
+                exc.NumericValueOutOfRangeError: {
+                    "http_status_code": 400,
+                    "message": "A numeric value is out of range.",
+                },
+                exc.DivisionByZeroError: {
+                    "http_status_code": 400,
+                    "message": "Attempted division by zero.",
+                },
+                exc.StringDataRightTruncationError: {
+                    "http_status_code": 400,
+                    "message": "Input string is too long for the column.",
+                },
+                exc.InvalidDatetimeFormatError: {
+                    "http_status_code": 400,
+                    "message": "Invalid datetime format.",
+                },
+                exc.ConnectionDoesNotExistError: {
                     "http_status_code": 503,
                     "message": "Database connection is not available.",
-                }
-            )
-        elif isinstance(e, asyncpg.exceptions.ConnectionFailureError):
-            error_info.update(
-                {
+                },
+                exc.ConnectionFailureError: {
                     "http_status_code": 503,
                     "message": "Failed to connect to the database.",
-                }
-            )
+                },
+            }
 
-        return error_info
+        return self._dispatch_mro(dispatch, e, error_info)
 
     def _handle_psycopg2_error(self, e: "psycopg2.Error") -> Dict[str, Any]:
         """Handle psycopg2 PostgreSQL errors."""
@@ -169,36 +251,30 @@ class DatabaseErrorHandler:
             "error_type": type(e).__name__,
         }
 
-        if isinstance(e, psycopg2.IntegrityError):
-            error_info.update(
-                {
+        dispatch = DatabaseErrorHandler._psycopg2_dispatch
+        if dispatch is None:
+            import psycopg2
+
+            dispatch = DatabaseErrorHandler._psycopg2_dispatch = {
+                psycopg2.IntegrityError: {
                     "http_status_code": 409,
                     "message": "Data integrity constraint violation.",
-                }
-            )
-        elif isinstance(e, psycopg2.OperationalError):
-            error_info.update(
-                {
+                },
+                psycopg2.OperationalError: {
                     "http_status_code": 503,
                     "message": "Database operation failed.",
-                }
-            )
-        elif isinstance(e, psycopg2.ProgrammingError):
-            error_info.update(
-                {
+                },
+                psycopg2.ProgrammingError: {
                     "http_status_code": 500,
                     "message": "Database programming error.",
-                }
-            )
-        elif isinstance(e, psycopg2.DataError):
-            error_info.update(
-                {
+                },
+                psycopg2.DataError: {
                     "http_status_code": 400,
                     "message": "Invalid data provided.",
-                }
-            )
+                },
+            }
 
-        return error_info
+        return self._dispatch_mro(dispatch, e, error_info)
 
     def _handle_sqlite3_error(self, e: "sqlite3.Error") -> Dict[str, Any]:
         """Handle SQLite3 errors."""
@@ -209,36 +285,30 @@ class DatabaseErrorHandler:
             "error_type": type(e).__name__,
         }
 
-        if isinstance(e, sqlite3.IntegrityError):
-            error_info.update(
-                {
+        dispatch = DatabaseErrorHandler._sqlite3_dispatch
+        if dispatch is None:
+            import sqlite3
+
+            dispatch = DatabaseErrorHandler._sqlite3_dispatch = {
+                sqlite3.IntegrityError: {
                     "http_status_code": 409,
                     "message": "Data integrity constraint violation.",
-                }
-            )
-        elif isinstance(e, sqlite3.OperationalError):
-            error_info.update(
-                {
+                },
+                sqlite3.OperationalError: {
                     "http_status_code": 503,
                     "message": "Database operation failed.",
-                }
-            )
-        elif isinstance(e, sqlite3.ProgrammingError):
-            error_info.update(
-                {
+                },
+                sqlite3.ProgrammingError: {
                     "http_status_code": 500,
                     "message": "Database programming error.",
-                }
-            )
-        elif isinstance(e, sqlite3.DataError):
-            error_info.update(
-                {
+                },
+                sqlite3.DataError: {
                     "http_status_code": 400,
                     "message": "Invalid data provided.",
-                }
-            )
+                },
+            }
 
-        return error_info
+        return self._dispatch_mro(dispatch, e, error_info)
 
     def _handle_pymongo_error(
         self, e: "pymongo.errors.PyMongoError"
@@ -251,36 +321,30 @@ class DatabaseErrorHandler:
             "error_type": type(e).__name__,
         }
 
-        if isinstance(e, pymongo.errors.DuplicateKeyError):
-            error_info.update(
-                {
+        dispatch = DatabaseErrorHandler._pymongo_dispatch
+        if dispatch is None:
+            import pymongo.errors
+
+            dispatch = DatabaseErrorHandler._pymongo_dispatch = {
+                pymongo.errors.DuplicateKeyError: {
                     "http_status_code": 409,
                     "message": "Document with this key already exists.",
-                }
-            )
-        elif isinstance(e, pymongo.errors.ConnectionFailure):
-            error_info.update(
-                {
+                },
+                pymongo.errors.ConnectionFailure: {
                     "http_status_code": 503,
                     "message": "Failed to connect to the database.",
-                }
-            )
-        elif isinstance(e, pymongo.errors.OperationFailure):
-            error_info.update(
-                {
+                },
+                pymongo.errors.OperationFailure: {
                     "http_status_code": 500,
                     "message": "Database operation failed.",
-                }
-            )
-        elif isinstance(e, pymongo.errors.ValidationError):
-            error_info.update(
-                {
+                },
+                pymongo.errors.ValidationError: {
                     "http_status_code": 400,
                     "message": "Document validation failed.",
-                }
-            )
+                },
+            }
 
-        return error_info
+        return self._dispatch_mro(dispatch, e, error_info)
 
     def _handle_redis_error(self, e: "redis.RedisError") -> Dict[str, Any]:
         """Handle Redis errors."""
@@ -291,113 +355,81 @@ class DatabaseErrorHandler:
             "error_type": type(e).__name__,
         }
 
-        if isinstance(e, redis.ConnectionError):
-            error_info.update(
-                {
+        dispatch = DatabaseErrorHandler._redis_dispatch
+        if dispatch is None:
+            import redis
+
+            dispatch = DatabaseErrorHandler._redis_dispatch = {
+                redis.ConnectionError: {
                     "message": "Failed to connect to cache service.",
-                }
-            )
-        elif isinstance(e, redis.TimeoutError):
-            error_info.update(
-                {
+                },
+                redis.TimeoutError: {
                     "http_status_code": 408,
                     "message": "Cache operation timeout.",
-                }
-            )
-        elif isinstance(e, redis.DataError):
-            error_info.update(
-                {
+                },
+                redis.DataError: {
                     "http_status_code": 400,
                     "message": "Invalid data for cache operation.",
-                }
-            )
+                },
+            }
 
-        return error_info
+        return self._dispatch_mro(dispatch, e, error_info)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _constraint_field(constraint) -> "str | None":
+        """Extract the field name from a constraint name in one regex pass.
+
+        A hot failure loop (e.g. bulk inserts tripping the same unique
+        constraint) hits the cache instead of re-parsing the same name.
+        """
+        if not constraint:
+            return None
+        match = _PREFIX_CONSTRAINT_RE.match(constraint)
+        if match is None:
+            match = _TABLE_CONSTRAINT_RE.match(constraint)
+        if match is None:
+            return None
+        return match.group("body").replace("_", " ")
 
     def _handle_unique_violation(
         self, e: "asyncpg.exceptions.UniqueViolationError"
     ) -> Dict[str, Any]:
         """Handle unique constraint violations."""
-        constraint = getattr(e, "constraint_name", None)
-        if constraint:
-            parts = constraint.split("_")
-            if len(parts) >= 3:
-                column = parts[1].replace("_", " ").capitalize()
-                return {
-                    "http_status_code": 409,
-                    "message": f"{column} already exists.",
-                }
-            else:
-                return {
-                    "http_status_code": 409,
-                    "message": "Resource already exists.",
-                }
-        else:
+        field = self._constraint_field(getattr(e, "constraint_name", None))
+        if field:
             return {
                 "http_status_code": 409,
-                "message": "Resource already exists.",
+                "message": f"{field.capitalize()} already exists.",
             }
+        return _MSG_RESOURCE_EXISTS
 
     def _handle_foreign_key_violation(
         self, e: "asyncpg.exceptions.ForeignKeyViolationError"
     ) -> Dict[str, Any]:
         """Handle foreign key constraint violations."""
         constraint = getattr(e, "constraint_name", None)
-        if constraint:
-            parts = constraint.split("_")
-            if len(parts) > 2:
-                middle_parts = [p for p in parts[1:-1] if p != "id"]
-                if middle_parts:
-                    field = " ".join(middle_parts).replace("_", " ")
-                    return {
-                        "http_status_code": 400,
-                        "message": f"Selected {field} does not exist.",
-                    }
-                else:
-                    return {
-                        "http_status_code": 400,
-                        "message": "Invalid foreign key reference.",
-                    }
-            elif constraint.startswith("fk_") and len(parts) == 2:
-                field = constraint[3:].replace("_", " ")
-                return {
-                    "http_status_code": 400,
-                    "message": f"Selected {field} does not exist.",
-                }
-            else:
-                return {
-                    "http_status_code": 400,
-                    "message": "Invalid foreign key reference.",
-                }
-        else:
+        field = self._constraint_field(constraint)
+        if field:
             return {
                 "http_status_code": 400,
-                "message": "Foreign key constraint failed.",
+                "message": f"Selected {field} does not exist.",
             }
+        if constraint:
+            return _MSG_FK_INVALID
+        return _MSG_FK_FAILED
 
     def _handle_check_violation(
         self, e: "asyncpg.exceptions.CheckViolationError"
     ) -> Dict[str, Any]:
         """Handle check constraint violations."""
-        constraint = getattr(e, "constraint_name", None)
-        if constraint:
-            parts = constraint.split("_")
-            if len(parts) >= 2:
-                field = parts[1].replace("_", " ")
-                return {
-                    "http_status_code": 400,
-                    "message": f"Invalid value for {field}.",
-                }
-            else:
-                return {
-                    "http_status_code": 400,
-                    "message": "Check constraint failed.",
-                }
-        else:
+        field = self._constraint_field(getattr(e, "constraint_name", None))
+        if field:
             return {
                 "http_status_code": 400,
-                "message": "Check constraint failed.",
+                "message": f"Invalid value for {field}.",
             }
+        return _MSG_CHECK_FAILED
 
     def _handle_not_null_violation(
         self, e: "asyncpg.exceptions.NotNullViolationError"
@@ -409,11 +441,7 @@ class DatabaseErrorHandler:
                 "http_status_code": 400,
                 "message": f"{column.replace('_', ' ').capitalize()} is required.",
             }
-        else:
-            return {
-                "http_status_code": 400,
-                "message": "A required field is missing.",
-            }
+        return _MSG_FIELD_REQUIRED
 
     def _handle_undefined_column(
         self, e: "asyncpg.exceptions.UndefinedColumnError"
@@ -422,7 +450,7 @@ class DatabaseErrorHandler:
         column = None
         if e.args and len(e.args) > 0:
             msg = e.args[0]
-            match = re.search(r'column "(?P<col>[^"]+)" does not exist', msg)
+            match = _UNDEFINED_COL_RE.search(msg)
             if match:
                 column = match.group("col")
 
@@ -432,11 +460,7 @@ class DatabaseErrorHandler:
                 "http_status_code": 500,
                 "message": f"{column_fmt.capitalize()} field does not exist.",
             }
-        else:
-            return {
-                "http_status_code": 500,
-                "message": "Invalid column reference.",
-            }
+        return _MSG_INVALID_COLUMN
 
     def _handle_data_error(
         self, e: "asyncpg.exceptions.DataError"
@@ -444,28 +468,5 @@ class DatabaseErrorHandler:
         """Handle data-related errors."""
         original_msg = str(e.args[0]).lower() if e.args else str(e).lower()
 
-        if "out of range" in original_msg:
-            return {
-                "http_status_code": 400,
-                "message": "Provided value is out of allowed range.",
-            }
-        elif "invalid input syntax" in original_msg:
-            return {
-                "http_status_code": 400,
-                "message": "Invalid input syntax for a field.",
-            }
-        elif "invalid input value for enum" in original_msg:
-            return {
-                "http_status_code": 400,
-                "message": "Invalid value provided for enum field.",
-            }
-        elif "invalid uuid" in original_msg:
-            return {
-                "http_status_code": 400,
-                "message": "Invalid ID format provided.",
-            }
-        else:
-            return {
-                "http_status_code": 400,
-                "message": "Invalid data provided.",
-            }
+        match = _DATA_ERR_RE.search(original_msg)
+        return _DATA_ERR_TEMPLATES[match.group(1)] if match else _MSG_INVALID_DATA
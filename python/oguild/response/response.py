@@ -1,6 +1,7 @@
 import functools
 import inspect
 import json
+import logging
 import sys
 import traceback
 import uuid
@@ -8,13 +9,37 @@ from http import HTTPStatus
 from typing import Any, Callable, Dict, List, Optional
 
 from oguild.logs import Logger
-
-from .errors import (AuthenticationErrorHandler, CommonErrorHandler,
-                     DatabaseErrorHandler, FileErrorHandler,
-                     NetworkErrorHandler, ValidationErrorHandler)
+from oguild.logs.logger import get_default_log_level
 
 logger = Logger("response").get_logger()
 
+# Handler classes resolve on first Error construction so that importing
+# this module for Ok/police keeps the error-handler modules unloaded.
+_error_handler_classes = None
+
+
+def _get_error_handler_classes():
+    global _error_handler_classes
+    if _error_handler_classes is None:
+        from .errors import (AuthenticationErrorHandler, CommonErrorHandler,
+                             DatabaseErrorHandler, FileErrorHandler,
+                             NetworkErrorHandler, ValidationErrorHandler)
+
+        _error_handler_classes = (
+            CommonErrorHandler,
+            DatabaseErrorHandler,
+            ValidationErrorHandler,
+            NetworkErrorHandler,
+            AuthenticationErrorHandler,
+            FileErrorHandler,
+        )
+    return _error_handler_classes
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 try:
     from fastapi import HTTPException as FastAPIHTTPException
     from fastapi.encoders import jsonable_encoder
@@ -46,14 +71,37 @@ try:
 except ImportError:
     WerkzeugHTTPException = None
 
+if orjson is not None and FastAPIJSONResponse is not None:
+
+    class ORJSONResponse(FastAPIJSONResponse):
+        """JSONResponse rendered with orjson.
+
+        orjson serializes UUID/datetime/date natively in C, so payloads
+        skip the jsonable_encoder pre-pass entirely.
+        """
+
+        media_type = "application/json"
+
+        def render(self, content: Any) -> bytes:
+            return orjson.dumps(
+                content,
+                default=_default_encoder,
+                option=orjson.OPT_NON_STR_KEYS,
+            )
+
+else:
+    ORJSONResponse = None
+
 
 def format_param(param, max_len=300):
     """Format a parameter nicely, truncate long strings."""
     if isinstance(param, str):
-        preview = param.replace("\n", "\\n")
-        if len(preview) > max_len:
-            preview = preview[:max_len] + "...[truncated]"
-        return f"'{preview}'"
+        # Truncate before escaping so a huge blob only pays for the
+        # first max_len characters instead of a full-length copy.
+        if len(param) > max_len:
+            preview = param[:max_len].replace("\n", "\\n")
+            return f"'{preview}...[truncated]'"
+        return "'{}'".format(param.replace("\n", "\\n"))
     return repr(param)
 
 
@@ -110,21 +158,45 @@ def police(
     return decorator
 
 
+@functools.lru_cache(maxsize=64)
+def _build_status_logger(code, level):
+    return Logger(str(code), log_level=level).get_logger()
+
+
+def _status_logger(code):
+    """Shared logger per HTTP status code.
+
+    Error previously built a logger named after each error's UUID, which
+    registered a new logger (and stream handler) in logging's manager
+    dict for every exception — unbounded growth under an error storm.
+    The cache is keyed on the configured default level too, so a later
+    global setLevel still takes effect.
+    """
+    return _build_status_logger(code, get_default_log_level())
+
+
 def _default_encoder(obj: Any):
     import dataclasses
     import datetime
+    import decimal
     import uuid
 
     if isinstance(obj, (datetime.date, datetime.datetime)):
         return obj.isoformat()
     if isinstance(obj, uuid.UUID):
         return str(obj)
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
     if dataclasses.is_dataclass(obj):
         return dataclasses.asdict(obj)
     if hasattr(obj, "dict"):  # Pydantic v1
         return obj.dict()
     if hasattr(obj, "model_dump"):  # Pydantic v2
         return obj.model_dump()
+    # Containers json can't take natively (tuple only matters on the
+    # json.dumps paths); without this the str fallback would emit reprs.
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
     return str(obj)
 
 
@@ -175,32 +247,84 @@ class Ok:
         if kwargs:
             payload.update(kwargs)
 
+        return cls._get_response_factory()(payload, status_code)
+
+    # Response factory, picked once per framework configuration; rebuilt
+    # only when the module-level response classes change (patched in
+    # tests), so the hot path is a cache hit plus one direct call.
+    _response_factory = None
+    _response_factory_key = None
+
+    @classmethod
+    def _get_response_factory(cls):
+        key = (
+            FastAPIJSONResponse,
+            StarletteJSONResponse,
+            DjangoJsonResponse,
+            FlaskResponse,
+        )
+        if key != cls._response_factory_key:
+            if ORJSONResponse is not None and FastAPIJSONResponse is not None:
+                # orjson renders UUID/datetime natively; no encoder pre-pass.
+                factory = (
+                    lambda payload, code, _c=ORJSONResponse: _c(
+                        content=payload, status_code=code
+                    )
+                )
+            elif FastAPIJSONResponse is not None:
+                factory = (
+                    lambda payload, code, _c=FastAPIJSONResponse: _c(
+                        content=cls._encode(payload), status_code=code
+                    )
+                )
+            elif StarletteJSONResponse is not None:
+                factory = (
+                    lambda payload, code, _c=StarletteJSONResponse: _c(
+                        content=cls._encode(payload), status_code=code
+                    )
+                )
+            elif DjangoJsonResponse is not None:
+                factory = (
+                    lambda payload, code, _c=DjangoJsonResponse: _c(
+                        cls._encode(payload), status=code
+                    )
+                )
+            elif FlaskResponse is not None:
+                factory = cls._flask_response
+            else:
+                factory = lambda payload, code: cls._encode(payload)
+            cls._response_factory = factory
+            cls._response_factory_key = key
+        return cls._response_factory
+
+    # Payloads made of these need no encoder pass at all.
+    _JSON_SAFE_SCALARS = (str, int, float, bool, type(None))
+
+    @staticmethod
+    def _encode(payload):
+        # Fast path: a flat payload of JSON-native scalars (the common
+        # {"status_code", "message"} shape) skips the encoder walk.
+        if all(
+            isinstance(v, Ok._JSON_SAFE_SCALARS) for v in payload.values()
+        ):
+            return payload
         if jsonable_encoder:
-            payload = jsonable_encoder(payload)
-        else:
-            payload = json.loads(json.dumps(payload, default=_default_encoder))
-
-        if FastAPIJSONResponse is not None:
-            return FastAPIJSONResponse(
-                content=payload, status_code=status_code
-            )
-
-        if StarletteJSONResponse is not None:
-            return StarletteJSONResponse(
-                content=payload, status_code=status_code
-            )
-
-        if DjangoJsonResponse is not None:
-            return DjangoJsonResponse(payload, status=status_code)
-
-        if FlaskResponse is not None:
-            return FlaskResponse(
-                json.dumps(payload, default=_default_encoder),
-                status=status_code,
-                mimetype="application/json",
-            )
-
-        return payload
+            return jsonable_encoder(payload)
+        return json.loads(json.dumps(payload, default=_default_encoder))
+
+    @staticmethod
+    def _flask_response(payload, code):
+        payload = Ok._encode(payload)
+        body = (
+            orjson.dumps(payload, default=_default_encoder)
+            if orjson is not None
+            else json.dumps(payload, default=_default_encoder)
+        )
+        return FlaskResponse(
+            body,
+            status=code,
+            mimetype="application/json",
+        )
 
 
 class Error(Exception):
@@ -214,6 +338,26 @@ class Error(Exception):
         raise Error(exception, status_code=500, message="Server error")
     """
 
+    # BaseException still provides a __dict__, so this buys faster
+    # attribute access rather than a smaller instance.
+    __slots__ = (
+        "e",
+        "msg",
+        "http_status_code",
+        "level",
+        "additional_info",
+        "include_stack_trace",
+        "include_error_attributes",
+        "error_id",
+        "logger",
+        "common_handler",
+        "database_handler",
+        "validation_handler",
+        "network_handler",
+        "auth_handler",
+        "file_handler",
+    )
+
     def __new__(
         cls,
         *args: Any,
@@ -314,18 +458,28 @@ class Error(Exception):
         if kwargs:
             self.additional_info.update(kwargs)
 
-        self.logger = Logger(self.error_id).get_logger()
+        self.logger = _status_logger(self.http_status_code or 500)
 
         # Handlers
-        self.common_handler = CommonErrorHandler(self.logger)
-        self.database_handler = DatabaseErrorHandler(self.logger)
-        self.validation_handler = ValidationErrorHandler(self.logger)
-        self.network_handler = NetworkErrorHandler(self.logger)
-        self.auth_handler = AuthenticationErrorHandler(self.logger)
-        self.file_handler = FileErrorHandler(self.logger)
+        (
+            common_cls,
+            database_cls,
+            validation_cls,
+            network_cls,
+            auth_cls,
+            file_cls,
+        ) = _get_error_handler_classes()
+        self.common_handler = common_cls(self.logger)
+        self.database_handler = database_cls(self.logger)
+        self.validation_handler = validation_cls(self.logger)
+        self.network_handler = network_cls(self.logger)
+        self.auth_handler = auth_cls(self.logger)
+        self.file_handler = file_cls(self.logger)
 
         if e:
             self._handle_error_with_handlers(e, msg=msg)
+            # Handlers may have settled the status code; log under it.
+            self.logger = _status_logger(self.http_status_code or 500)
 
         if _raise_immediately:
             raise self.to_framework_exception()
@@ -333,16 +487,19 @@ class Error(Exception):
     def _handle_error_with_handlers(
         self, e: Exception, msg: Optional[str] = None
     ):
-        if self.database_handler._is_database_error(e):
-            info = self.database_handler.handle_error(e)
-        elif self.validation_handler._is_validation_error(e):
-            info = self.validation_handler.handle_error(e)
-        elif self.auth_handler._is_auth_error(e):
-            info = self.auth_handler.handle_error(e)
-        elif self.file_handler._is_file_error(e):
-            info = self.file_handler.handle_error(e)
-        elif self.network_handler._is_network_error(e):
-            info = self.network_handler.handle_error(e)
+        for probe, handler in (
+            (self.database_handler._is_database_error, self.database_handler),
+            (
+                self.validation_handler._is_validation_error,
+                self.validation_handler,
+            ),
+            (self.auth_handler._is_auth_error, self.auth_handler),
+            (self.file_handler._is_file_error, self.file_handler),
+            (self.network_handler._is_network_error, self.network_handler),
+        ):
+            if probe(e):
+                info = handler.handle_error(e)
+                break
         else:
             info = self.common_handler.handle_error(e)
 
@@ -360,19 +517,23 @@ class Error(Exception):
 
     def to_dict(self):
         if self.e:
-            if self.include_error_attributes:
-                self.logger.debug(
-                    f"Error attributes: {self.common_handler.get_exception_attributes(self.e)}"
-                )
-            if self.include_stack_trace:
-                self.logger.debug(
-                    "Stack trace:\n"
-                    + "".join(
-                        traceback.format_exception(
-                            type(self.e), self.e, self.e.__traceback__
-                        )
+            # Attribute reflection and traceback formatting are debug-only
+            # output; skip the work entirely when DEBUG is off.
+            if self.logger.isEnabledFor(logging.DEBUG):
+                if self.include_error_attributes:
+                    self.logger.debug(
+                        "Error attributes: %s",
+                        self.common_handler.get_exception_attributes(self.e),
+                    )
+                if self.include_stack_trace:
+                    self.logger.debug(
+                        "Stack trace:\n%s",
+                        "".join(
+                            traceback.format_exception(
+                                type(self.e), self.e, self.e.__traceback__
+                            )
+                        ),
                     )
-                )
         else:
             self.logger.error(self.msg)
 
@@ -394,20 +555,72 @@ class Error(Exception):
             **self.additional_info,
         }
 
+    # Framework exception factories, rebuilt only when the framework
+    # classes visible in this module change (absent at runtime, patched
+    # in tests); the common case is a cache hit on every error.
+    _exc_passthrough = ()
+    _exc_factories = ()
+    _exc_cache_key = None
+
+    @classmethod
+    def _get_exc_dispatch(cls):
+        key = (
+            FastAPIHTTPException,
+            StarletteHTTPException,
+            DjangoJsonResponse,
+            WerkzeugHTTPException,
+        )
+        if key != cls._exc_cache_key:
+            cls._exc_passthrough = tuple(
+                c
+                for c in (
+                    FastAPIHTTPException,
+                    StarletteHTTPException,
+                    WerkzeugHTTPException,
+                )
+                if c is not None
+            )
+            factories = []
+            if FastAPIHTTPException is not None:
+                factories.append(
+                    lambda code, detail, _c=FastAPIHTTPException: _c(
+                        status_code=code, detail=detail
+                    )
+                )
+            if StarletteHTTPException is not None:
+                factories.append(
+                    lambda code, detail, _c=StarletteHTTPException: _c(
+                        status_code=code, detail=detail
+                    )
+                )
+            if DjangoJsonResponse is not None:
+                factories.append(cls._django_exception)
+            if WerkzeugHTTPException is not None:
+                factories.append(cls._werkzeug_exception)
+            cls._exc_factories = tuple(factories)
+            cls._exc_cache_key = key
+        return cls._exc_passthrough, cls._exc_factories
+
+    @staticmethod
+    def _django_exception(code, detail):
+        try:
+            return DjangoJsonResponse(detail, status=code)
+        except Exception:
+            # Fall through to the next factory (e.g. Werkzeug).
+            return None
+
+    @staticmethod
+    def _werkzeug_exception(code, detail):
+        exception = WerkzeugHTTPException(description=json.dumps(detail))
+        exception.code = code
+        return exception
+
     def to_framework_exception(self):
-        # If the underlying exception is already a framework exception or Error,
-        # return it directly to avoid any double-wrapping
-        if FastAPIHTTPException is not None and isinstance(
-            self.e, FastAPIHTTPException
-        ):
-            return self.e
-        if StarletteHTTPException is not None and isinstance(
-            self.e, StarletteHTTPException
-        ):
-            return self.e
-        if WerkzeugHTTPException is not None and isinstance(
-            self.e, WerkzeugHTTPException
-        ):
+        passthrough, factories = self._get_exc_dispatch()
+
+        # If the underlying exception is already a framework exception or
+        # Error, return it directly to avoid any double-wrapping.
+        if passthrough and isinstance(self.e, passthrough):
             return self.e
         if isinstance(self.e, Error):
             # Delegate to the inner Error's framework exception
@@ -415,29 +628,10 @@ class Error(Exception):
 
         error_dict = self.to_dict()
 
-        if FastAPIHTTPException:
-            return FastAPIHTTPException(
-                status_code=self.http_status_code, detail=error_dict
-            )
-        if StarletteHTTPException:
-            return StarletteHTTPException(
-                status_code=self.http_status_code, detail=error_dict
-            )
-        if DjangoJsonResponse:
-            try:
-                return DjangoJsonResponse(
-                    error_dict, status=self.http_status_code
-                )
-            except Exception:
-                pass
-        if WerkzeugHTTPException:
-            import json
-
-            exception = WerkzeugHTTPException(
-                description=json.dumps(error_dict)
-            )
-            exception.code = self.http_status_code
-            return exception
+        for factory in factories:
+            exception = factory(self.http_status_code, error_dict)
+            if exception is not None:
+                return exception
 
         return Exception(self.msg)
 
@@ -1,9 +1,10 @@
 """Alias for oguild.response module - allows importing from oguild.responses or oguild.response."""
 
-# Import everything from the response module
-from ..response import *
+from ..response import Error, Ok, police
 
-# Re-export everything for backward compatibility
+# Re-export everything for backward compatibility; handler classes
+# resolve lazily through oguild.response (PEP 562) so this alias does
+# not defeat its deferred imports.
 __all__ = [
     "Ok",
     "Error",
@@ -15,3 +16,17 @@ __all__ = [
     "AuthenticationErrorHandler",
     "FileErrorHandler",
 ]
+
+
+def __getattr__(name):
+    if name in __all__:
+        from .. import response
+
+        obj = getattr(response, name)
+        globals()[name] = obj
+        return obj
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(__all__)
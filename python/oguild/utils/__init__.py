@@ -2,6 +2,7 @@ from .decoder import decode_json_fields
 from .encoder import encode_json_fields
 from .sanitizer import (
     sanitize_fields,
+    sanitize_fields_sync,
     convert_value,
     filter_null_fields,
     serialize_response,
@@ -34,6 +35,7 @@ from .case_converter import (
 __all__ = [
     # Sanitizer functions
     "sanitize_fields",
+    "sanitize_fields_sync",
     "encode_json_fields",
     "decode_json_fields",
     "convert_value",
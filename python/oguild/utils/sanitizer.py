@@ -1,3 +1,4 @@
+import inspect
 from datetime import date, datetime, time, timezone
 from decimal import Decimal
 from typing import Any, Callable, Dict, Optional, TYPE_CHECKING
@@ -8,19 +9,114 @@ if TYPE_CHECKING:
 
 from pydantic import BaseModel
 
-DEFAULT_EMPTY_VALUES = {None, ""}
+DEFAULT_EMPTY_VALUES = frozenset({None, ""})
 DEFAULT_KEY_MAPPING = {
     "_id": "id",
 }
 DEFAULT_FIELD_PROCESSORS: Dict[str, Callable[[Any], Any]] = {}
 
 
+def _may_return_awaitable(processor) -> bool:
+    """True unless ``processor`` is provably a plain sync callable.
+
+    Async-def functions are the obvious case, but objects with an async
+    ``__call__`` and wrappers like ``functools.partial`` can also hand
+    back awaitables; anything we cannot classify goes through the async
+    walker, which awaits results as needed.
+    """
+    if inspect.iscoroutinefunction(processor):
+        return True
+    if inspect.iscoroutinefunction(getattr(processor, "__call__", None)):
+        return True
+    return not (
+        inspect.isfunction(processor)
+        or inspect.ismethod(processor)
+        or inspect.isbuiltin(processor)
+    )
+
+
 async def sanitize_fields(
     data: Any,
     empty_values: set = DEFAULT_EMPTY_VALUES,
     key_mapping: dict = DEFAULT_KEY_MAPPING,
     field_processors: dict = DEFAULT_FIELD_PROCESSORS,
 ) -> Any:
+    # The walk itself does no I/O; only awaitable-returning field
+    # processors need an event loop. Everything else runs through the
+    # synchronous walker so a deep payload costs one coroutine instead
+    # of one per node.
+    if field_processors and any(
+        _may_return_awaitable(p) for p in field_processors.values()
+    ):
+        return await _sanitize_fields_async(
+            data, empty_values, key_mapping, field_processors
+        )
+    return sanitize_fields_sync(
+        data, empty_values, key_mapping, field_processors
+    )
+
+
+def sanitize_fields_sync(
+    data: Any,
+    empty_values: set = DEFAULT_EMPTY_VALUES,
+    key_mapping: dict = DEFAULT_KEY_MAPPING,
+    field_processors: dict = DEFAULT_FIELD_PROCESSORS,
+) -> Any:
+    """Synchronous variant of :func:`sanitize_fields`.
+
+    Field processors, if given, must be plain callables.
+    """
+    if isinstance(data, BaseModel):
+        return sanitize_fields_sync(
+            data.model_dump(exclude_none=True),
+            empty_values,
+            key_mapping,
+            field_processors,
+        )
+
+    if isinstance(data, dict):
+        # Hoist per-iteration lookups out of the loop; on deep payloads
+        # the walk is dominated by exactly these dict/global accesses.
+        sanitized = {}
+        map_key = key_mapping.get
+        get_processor = field_processors.get if field_processors else None
+        for key, value in data.items():
+            if _is_empty(value, empty_values):
+                continue
+
+            new_key = map_key(key, key)
+
+            processor = get_processor(new_key) if get_processor else None
+            if processor:
+                try:
+                    sanitized[new_key] = processor(value)
+                except Exception:
+                    sanitized[new_key] = value
+                continue
+
+            sanitized[new_key] = sanitize_fields_sync(
+                value, empty_values, key_mapping, field_processors
+            )
+        return sanitized
+
+    if isinstance(data, list):
+        sanitized_list = []
+        append = sanitized_list.append
+        for v in data:
+            item = sanitize_fields_sync(
+                v, empty_values, key_mapping, field_processors
+            )
+            if not _is_empty(item, empty_values):
+                append(item)
+        return sanitized_list
+
+    return _sanitize_primitive(data, empty_values)
+
+
+async def _sanitize_fields_async(
+    data, empty_values, key_mapping, field_processors
+):
+    """Recursive walker used only when a coroutine field processor is set."""
     if isinstance(data, BaseModel):
         return await _sanitize_model(
             data, empty_values, key_mapping, field_processors
@@ -37,13 +133,11 @@ async def sanitize_fields(
 
 
 async def _sanitize_model(data, empty_values, key_mapping, field_processors):
-    try:
-        model_data = data.model_dump(exclude_none=True)
-    except AttributeError:
-        model_data = data.dict(exclude_none=True)
-
-    return await sanitize_fields(
-        model_data, empty_values, key_mapping, field_processors
+    return await _sanitize_fields_async(
+        data.model_dump(exclude_none=True),
+        empty_values,
+        key_mapping,
+        field_processors,
     )
 
 
@@ -58,12 +152,15 @@ async def _sanitize_dict(data, empty_values, key_mapping, field_processors):
         processor = field_processors.get(new_key)
         if processor:
             try:
-                sanitized[new_key] = await processor(value)
+                result = processor(value)
+                if inspect.isawaitable(result):
+                    result = await result
+                sanitized[new_key] = result
             except Exception:
                 sanitized[new_key] = value
             continue
 
-        sanitized[new_key] = await sanitize_fields(
+        sanitized[new_key] = await _sanitize_fields_async(
             value, empty_values, key_mapping, field_processors
         )
 
@@ -72,13 +169,30 @@ async def _sanitize_dict(data, empty_values, key_mapping, field_processors):
 
 async def _sanitize_list(data, empty_values, key_mapping, field_processors):
     sanitized_list = [
-        await sanitize_fields(v, empty_values, key_mapping, field_processors)
+        await _sanitize_fields_async(
+            v, empty_values, key_mapping, field_processors
+        )
         for v in data
     ]
     return [v for v in sanitized_list if not _is_empty(v, empty_values)]
 
 
+# Exact-type dispatch for scalar leaves: one dict lookup instead of the
+# chained isinstance checks, which dominate on payloads full of
+# UUID/datetime values. Subclasses (rare) fall back to the chain below.
+_SCALAR_CONV = {
+    UUID: str,
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    time: lambda t: t.strftime("%H:%M:%S"),
+    Decimal: float,
+}
+
+
 def _sanitize_primitive(data, empty_values):
+    conv = _SCALAR_CONV.get(type(data))
+    if conv is not None:
+        return conv(data)
     if isinstance(data, UUID):
         return str(data)
     if isinstance(data, (datetime, date)):
@@ -91,9 +205,13 @@ def _sanitize_primitive(data, empty_values):
 
 
 def _is_empty(value, empty_values):
-    if isinstance(value, (list, dict)):
+    # None is by far the most common empty leaf; an identity check beats
+    # set membership and short-circuits the isinstance probes.
+    if value is None:
+        return None in empty_values
+    if isinstance(value, (list, dict, tuple, set)):
         return not value
-    return value in empty_values or value == [] or value == {}
+    return value in empty_values
 
 
 # ============================================================================
@@ -1,4 +1,5 @@
 import logging
+import logging.handlers
 import os
 import tempfile
 from unittest.mock import patch
@@ -144,7 +145,15 @@ class TestLogger:
 
             handler_types = [type(h) for h in logger.logger.handlers]
             assert logging.StreamHandler in handler_types
-            assert logging.FileHandler in handler_types
+            # File output is buffered through a MemoryHandler wrapping
+            # the FileHandler.
+            assert logging.handlers.MemoryHandler in handler_types
+            memory_handler = next(
+                h
+                for h in logger.logger.handlers
+                if isinstance(h, logging.handlers.MemoryHandler)
+            )
+            assert isinstance(memory_handler.target, logging.FileHandler)
         finally:
             if os.path.exists(log_file):
                 os.unlink(log_file)
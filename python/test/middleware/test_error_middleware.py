@@ -4,30 +4,49 @@ Tests for ErrorMiddleware
 
 from unittest.mock import Mock, patch
 
-# import pytest  # Not used in this test
+import pytest
 from oguild.middleware import ErrorMiddleware, create_error_middleware
 from oguild.response import Error
 
 
+# The middleware never calls into the app in these tests; a plain
+# object is a cheaper placeholder than a MagicMock.
+_DUMMY_APP = object()
+
+
+@pytest.fixture(scope="module")
+def default_mw():
+    """Shared default-config middleware; the tests never mutate it."""
+    return ErrorMiddleware(_DUMMY_APP)
+
+
+@pytest.fixture(scope="module")
+def chained_runtime_error():
+    """Prebuilt ValueError -> RuntimeError chain; traceback capture is
+    surprisingly costly, so build it once per module."""
+    try:
+        try:
+            raise ValueError("Inner error")
+        except ValueError as e:
+            raise RuntimeError("Outer error") from e
+    except RuntimeError as exc:
+        return exc
+
+
 class TestErrorMiddleware:
     """Test ErrorMiddleware functionality"""
 
     def _create_middleware(self, **kwargs):
-        """Helper to create middleware with mock app"""
-        from unittest.mock import Mock
+        """Helper to create middleware with a placeholder app"""
+        return ErrorMiddleware(_DUMMY_APP, **kwargs)
 
-        mock_app = Mock()
-        return ErrorMiddleware(mock_app, **kwargs)
-
-    def test_error_middleware_initialization(self):
+    def test_error_middleware_initialization(self, default_mw):
         """Test ErrorMiddleware initializes with default values"""
-        middleware = self._create_middleware()
-
         assert (
-            middleware.default_error_message == "An unexpected error occurred"
+            default_mw.default_error_message == "An unexpected error occurred"
         )
-        assert middleware.default_error_code == 500
-        assert middleware.include_request_info is False
+        assert default_mw.default_error_code == 500
+        assert default_mw.include_request_info is False
 
     def test_error_middleware_custom_initialization(self):
         """Test ErrorMiddleware initializes with custom values"""
@@ -92,9 +111,9 @@ class TestErrorMiddleware:
         assert isinstance(error, Error)
         assert error.additional_info == {}
 
-    def test_create_response(self):
+    def test_create_response(self, default_mw):
         """Test create_response returns framework exception"""
-        middleware = self._create_middleware()
+        middleware = default_mw
         exc = ValueError("Test error")
         error = middleware.handle_exception(exc)
 
@@ -103,9 +122,9 @@ class TestErrorMiddleware:
         # Should return the framework exception from error.to_framework_exception()
         assert response is not None
 
-    def test_create_response_with_different_exceptions(self):
+    def test_create_response_with_different_exceptions(self, default_mw):
         """Test create_response with different exception types"""
-        middleware = self._create_middleware()
+        middleware = default_mw
 
         # Test with ValueError
         error1 = middleware.handle_exception(ValueError("Value error"))
@@ -169,9 +188,9 @@ class TestErrorMiddleware:
     #     assert "Custom test error" in error.msg
     #     assert error.http_status_code == 422
 
-    def test_error_middleware_with_none_exception(self):
+    def test_error_middleware_with_none_exception(self, default_mw):
         """Test handle_exception with None exception"""
-        middleware = self._create_middleware()
+        middleware = default_mw
 
         error = middleware.handle_exception(None)
 
@@ -179,9 +198,9 @@ class TestErrorMiddleware:
         assert error.e is None
         assert "None" in error.msg
 
-    def test_error_middleware_with_string_exception(self):
+    def test_error_middleware_with_string_exception(self, default_mw):
         """Test handle_exception with string exception"""
-        middleware = self._create_middleware()
+        middleware = default_mw
 
         error = middleware.handle_exception("String error")
 
@@ -196,8 +215,7 @@ class TestCreateErrorMiddleware:
     def test_create_error_middleware_default(self):
         """Test create_error_middleware with default parameters"""
         MiddlewareClass = create_error_middleware()
-        mock_app = Mock()
-        middleware = MiddlewareClass(mock_app)
+        middleware = MiddlewareClass(_DUMMY_APP)
 
         assert isinstance(middleware, ErrorMiddleware)
         assert (
@@ -213,8 +231,7 @@ class TestCreateErrorMiddleware:
             default_error_code=400,
             include_request_info=False,
         )
-        mock_app = Mock()
-        middleware = MiddlewareClass(mock_app)
+        middleware = MiddlewareClass(_DUMMY_APP)
 
         assert isinstance(middleware, ErrorMiddleware)
         assert middleware.default_error_message == "Custom factory error"
@@ -224,8 +241,7 @@ class TestCreateErrorMiddleware:
     def test_create_error_middleware_with_app(self):
         """Test create_error_middleware with app parameter"""
         MiddlewareClass = create_error_middleware()
-        mock_app = Mock()
-        middleware = MiddlewareClass(mock_app)
+        middleware = MiddlewareClass(_DUMMY_APP)
 
         assert isinstance(middleware, ErrorMiddleware)
         assert (
@@ -253,15 +269,12 @@ class TestErrorMiddlewareFrameworkIntegration:
     """Test ErrorMiddleware with framework detection"""
 
     def _create_middleware(self, **kwargs):
-        """Helper to create middleware with mock app"""
-        from unittest.mock import Mock
+        """Helper to create middleware with a placeholder app"""
+        return ErrorMiddleware(_DUMMY_APP, **kwargs)
 
-        mock_app = Mock()
-        return ErrorMiddleware(mock_app, **kwargs)
-
-    def test_framework_detection_works(self):
+    def test_framework_detection_works(self, default_mw):
         """Test that ErrorMiddleware detects and uses available framework"""
-        middleware = self._create_middleware()
+        middleware = default_mw
         exc = ValueError("Framework test error")
         error = middleware.handle_exception(exc)
         response = middleware.create_response(error)
@@ -314,29 +327,27 @@ class TestErrorMiddlewareFrameworkIntegration:
     #     elif hasattr(response, "description"):
     #         assert response.description is not None
 
-    def test_framework_with_mocked_django(self):
+    def test_framework_with_mocked_django(self, default_mw):
         """Test framework detection with mocked Django"""
 
-        middleware = self._create_middleware()
+        middleware = default_mw
         exc = ValueError("Django mock test error")
         error = middleware.handle_exception(exc)
 
         # Mock FastAPI and Starlette to be None, Django to be available
-        with patch(
-            "oguild.response.response.FastAPIHTTPException", None
-        ), patch(
-            "oguild.response.response.StarletteHTTPException", None
-        ), patch(
-            "oguild.response.response.DjangoJsonResponse"
-        ) as mock_django:
-
-            mock_response = type(
-                "MockDjangoResponse",
-                (),
-                {"status_code": 400, "content": b'{"message": "test"}'},
-            )()
-            mock_django.return_value = mock_response
-
+        mock_response = type(
+            "MockDjangoResponse",
+            (),
+            {"status_code": 400, "content": b'{"message": "test"}'},
+        )()
+        mock_django = Mock(return_value=mock_response)
+
+        with patch.multiple(
+            "oguild.response.response",
+            FastAPIHTTPException=None,
+            StarletteHTTPException=None,
+            DjangoJsonResponse=mock_django,
+        ):
             response = middleware.create_response(error)
 
             assert response is not None
@@ -380,9 +391,9 @@ class TestErrorMiddlewareFrameworkIntegration:
     #         assert hasattr(response, "description")
     #         assert response.code == 400
 
-    def test_framework_detection_priority(self):
+    def test_framework_detection_priority(self, default_mw):
         """Test that framework detection works in priority order"""
-        middleware = self._create_middleware()
+        middleware = default_mw
         exc = ValueError("Priority test error")
         error = middleware.handle_exception(exc)
         response = middleware.create_response(error)
@@ -405,9 +416,9 @@ class TestErrorMiddlewareFrameworkIntegration:
             has_framework_attrs
         ), f"Response {type(response)} doesn't have expected framework attributes"
 
-    def test_framework_response_consistency(self):
+    def test_framework_response_consistency(self, default_mw):
         """Test that framework responses are consistent across calls"""
-        middleware = self._create_middleware()
+        middleware = default_mw
         exc = ValueError("Consistency test error")
 
         # Create multiple errors with same exception
@@ -493,11 +504,8 @@ class TestErrorMiddlewareIntegration:
     """Test ErrorMiddleware integration scenarios"""
 
     def _create_middleware(self, **kwargs):
-        """Helper to create middleware with mock app"""
-        from unittest.mock import Mock
-
-        mock_app = Mock()
-        return ErrorMiddleware(mock_app, **kwargs)
+        """Helper to create middleware with a placeholder app"""
+        return ErrorMiddleware(_DUMMY_APP, **kwargs)
 
     def test_middleware_with_complex_request_info(self):
         """Test middleware with complex request information"""
@@ -523,25 +531,19 @@ class TestErrorMiddlewareIntegration:
         assert error.additional_info["user_id"] == "user123"
         assert error.additional_info["session_id"] == "session456"
 
-    def test_middleware_error_chain(self):
+    def test_middleware_error_chain(self, default_mw, chained_runtime_error):
         """Test middleware with chained exceptions"""
-        middleware = self._create_middleware()
+        middleware = default_mw
 
-        try:
-            try:
-                raise ValueError("Inner error")
-            except ValueError as e:
-                raise RuntimeError("Outer error") from e
-        except RuntimeError as exc:
-            error = middleware.handle_exception(exc)
+        error = middleware.handle_exception(chained_runtime_error)
 
-            assert isinstance(error, Error)
-            assert error.e == exc
-            assert "Outer error" in error.msg
+        assert isinstance(error, Error)
+        assert error.e == chained_runtime_error
+        assert "Outer error" in error.msg
 
-    def test_middleware_with_empty_request_info(self):
+    def test_middleware_with_empty_request_info(self, default_mw):
         """Test middleware with empty request info"""
-        middleware = self._create_middleware()
+        middleware = default_mw
         exc = ValueError("Test error")
         request_info = {}
 
@@ -550,9 +552,9 @@ class TestErrorMiddlewareIntegration:
         assert isinstance(error, Error)
         assert error.additional_info == {}
 
-    def test_middleware_with_none_request_info(self):
+    def test_middleware_with_none_request_info(self, default_mw):
         """Test middleware with None request info"""
-        middleware = self._create_middleware()
+        middleware = default_mw
         exc = ValueError("Test error")
 
         error = middleware.handle_exception(exc, None)
@@ -560,9 +562,9 @@ class TestErrorMiddlewareIntegration:
         assert isinstance(error, Error)
         assert error.additional_info == {}
 
-    def test_middleware_response_consistency(self):
+    def test_middleware_response_consistency(self, default_mw):
         """Test that create_response returns consistent results"""
-        middleware = self._create_middleware()
+        middleware = default_mw
         exc = ValueError("Consistent error")
 
         error1 = middleware.handle_exception(exc)
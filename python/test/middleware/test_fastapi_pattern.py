@@ -6,14 +6,14 @@ Test FastAPI usage pattern with ErrorMiddleware
 import pytest
 from oguild import ErrorMiddleware
 
+FastAPI = pytest.importorskip("fastapi").FastAPI
+
 
 class TestFastAPIPattern:
     """Test ErrorMiddleware with FastAPI framework"""
 
     def test_fastapi_pattern(self):
         """Test FastAPI usage pattern"""
-        from fastapi import FastAPI
-
         app = FastAPI()
         app.add_middleware(ErrorMiddleware)
 
@@ -22,8 +22,6 @@ class TestFastAPIPattern:
 
     def test_fastapi_middleware_initialization_with_app(self):
         """Test ErrorMiddleware can be initialized with FastAPI app"""
-        from fastapi import FastAPI
-
         app = FastAPI()
         middleware = ErrorMiddleware(app)
 
@@ -31,8 +29,6 @@ class TestFastAPIPattern:
 
     def test_fastapi_asgi_detection(self):
         """Test ASGI framework detection with FastAPI"""
-        from fastapi import FastAPI
-
         app = FastAPI()
         middleware = ErrorMiddleware(app)
         # Check that it inherits from BaseHTTPMiddleware when app is provided
@@ -3,7 +3,7 @@
 Test Flask usage pattern with ErrorMiddleware
 """
 
-# import pytest  # Not used in this test
+import pytest
 from oguild import ErrorMiddleware
 
 
@@ -28,23 +28,25 @@ class TestFlaskPattern:
             assert isinstance(content, dict)
             assert isinstance(status_code, int)
 
-    def test_flask_error_handler_integration(self):
-        """Test Flask error handler integration"""
-        error_middleware = ErrorMiddleware()
-
-        test_exceptions = [
+    @pytest.mark.parametrize(
+        "exc",
+        [
             ValueError("Value error"),
             TypeError("Type error"),
             RuntimeError("Runtime error"),
             Exception("Generic error"),
-        ]
+        ],
+        ids=lambda e: type(e).__name__,
+    )
+    def test_flask_error_handler_integration(self, exc):
+        """Test Flask error handler integration"""
+        error_middleware = ErrorMiddleware()
 
-        for exc in test_exceptions:
-            content, status_code = error_middleware.flask_error_handler(exc)
+        content, status_code = error_middleware.flask_error_handler(exc)
 
-            assert isinstance(content, dict)
-            assert isinstance(status_code, int)
-            assert "message" in content
-            assert "status_code" in content
-            assert "error" in content
-            assert "error_id" in content["error"]
+        assert isinstance(content, dict)
+        assert isinstance(status_code, int)
+        assert "message" in content
+        assert "status_code" in content
+        assert "error" in content
+        assert "error_id" in content["error"]
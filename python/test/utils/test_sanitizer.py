@@ -157,6 +157,21 @@ class TestSanitizeFields:
         expected = {"name": "TEST", "description": "hello"}
         assert result == expected
 
+    @pytest.mark.asyncio
+    async def test_sanitize_async_callable_processor(self):
+        """Test processors with an async __call__ are awaited."""
+
+        class UppercaseProcessor:
+            async def __call__(self, value):
+                return value.upper() if isinstance(value, str) else value
+
+        data = {"name": "test", "description": "hello"}
+        field_processors = {"name": UppercaseProcessor()}
+        result = await sanitize_fields(data, field_processors=field_processors)
+
+        expected = {"name": "TEST", "description": "hello"}
+        assert result == expected
+
     @pytest.mark.asyncio
     async def test_sanitize_field_processor_error(self):
         """Test field processor error handling."""